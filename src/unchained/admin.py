@@ -1,23 +1,30 @@
 from typing import TYPE_CHECKING, Iterable
 
-from django.contrib import admin
-from django.contrib.admin import ModelAdmin
-
 if TYPE_CHECKING:
+    from django.contrib.admin import ModelAdmin
+
     from unchained.models.base import BaseModel
 
 
 class UnchainedAdmin:
+    # django.contrib.admin is imported lazily so API-only processes never load the admin stack
+
     def register(
         self,
         model_or_iterable: type["BaseModel"] | Iterable[type["BaseModel"]],
-        admin_class: type[ModelAdmin] | None = None,
+        admin_class: type["ModelAdmin"] | None = None,
         **options,
     ):
+        from django.contrib import admin
+
         admin.site.register(model_or_iterable, admin_class, **options)
 
     def unregister(self, model):
+        from django.contrib import admin
+
         admin.site.unregister(model)
 
     def get_urls(self):
+        from django.contrib import admin
+
         return admin.site.get_urls()
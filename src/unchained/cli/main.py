@@ -43,11 +43,15 @@ def runserver(
     2. pyproject.toml [tool.unchained] settings
     3. Common app patterns in current directory
     """
-    path, _, _ = _load_app(app_path)
+    from unchained.cli.utils import get_app_import_string, get_app_path_arg
+
+    # The module is only located here, uvicorn imports it itself (in a subprocess when reloading)
+    path = get_app_import_string(get_app_path_arg(app_path))
 
     # Only import uvicorn when needed
     import uvicorn
 
+    # loop/http default to "auto", which picks uvloop and httptools from uvicorn[standard] when available
     uvicorn.run(path, host=host, port=port, reload=reload, factory=True)
 
 
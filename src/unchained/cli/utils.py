@@ -19,12 +19,12 @@ def find_app_path():
 
     from pathlib import Path
 
-    import tomli
-
     pyproject_path = Path("pyproject.toml")
     if pyproject_path.exists():
+        import tomllib
+
         with open(pyproject_path, "rb") as f:
-            pyproject = tomli.load(f)
+            pyproject = tomllib.load(f)
             if "tool" in pyproject and "unchained" in pyproject["tool"]:
                 if "app_path" in pyproject["tool"]["unchained"]:
                     return pyproject["tool"]["unchained"]["app_path"]
@@ -47,6 +47,15 @@ def get_app_path_arg(value: Optional[str]):
     return value
 
 
+def split_app_path(app_path: str) -> tuple[str, str]:
+    """Split a `module:instance` app path into the importable module path and the instance name"""
+    module_path, app_instance = app_path.split(":", 1)
+    if module_path.endswith(".py"):
+        # If it's a .py file, remove the extension
+        module_path = module_path[:-3]
+    return module_path, app_instance
+
+
 def load_app_module(app_path: str):
     """Load the app module and get the Unchained instance"""
     # Ensure the current directory is in the Python path
@@ -58,15 +67,10 @@ def load_app_module(app_path: str):
     if "" not in sys.path:
         sys.path.insert(0, "")
 
-    # Parse the app_path
-    module_path, app_instance = app_path.split(":", 1)
+    module_path, app_instance = split_app_path(app_path)
 
     # Check if module exists
     try:
-        # Just try to import to verify it exists
-        if module_path.endswith(".py"):
-            # If it's a .py file, remove the extension
-            module_path = module_path[:-3]
         module = importlib.import_module(module_path)
         return module, getattr(module, app_instance)
     except ImportError as e:
@@ -79,6 +83,69 @@ def load_app_module(app_path: str):
         sys.exit(1)
 
 
+def get_app_import_string(app_path: str) -> str:
+    """Check that the app module and instance exist and return the `module:instance` import string
+
+    The module is only imported when the instance cannot be found in its source.
+    """
+    import sys
+    from importlib.util import find_spec
+
+    from typer import echo
+
+    if "" not in sys.path:
+        sys.path.insert(0, "")
+
+    module_path, app_instance = split_app_path(app_path)
+
+    try:
+        spec = find_spec(module_path)
+    except ModuleNotFoundError:
+        # A parent package of the module is missing
+        spec = None
+
+    if spec is None:
+        echo(f"Error: Could not find module '{module_path}'")
+        sys.exit(1)
+
+    if not _module_defines(spec.origin, app_instance):
+        # Not found in the module source (star import, dynamic assignment...): import it to check the attribute
+        load_app_module(app_path)
+
+    return f"{module_path}:{app_instance}"
+
+
+def _module_defines(origin: str | None, name: str) -> bool:
+    """Check whether the module source at `origin` binds `name` at its top level, without executing it"""
+    import ast
+
+    if not origin or not origin.endswith(".py"):
+        return False
+
+    try:
+        with open(origin, "rb") as f:
+            tree = ast.parse(f.read(), filename=origin)
+    except (OSError, SyntaxError):
+        return False
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names = [node.name]
+        elif isinstance(node, ast.Assign):
+            names = [n.id for target in node.targets for n in ast.walk(target) if isinstance(n, ast.Name)]
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            # A bare `app: Unchained` annotation does not bind the name
+            names = [n.id for n in ast.walk(node.target) if isinstance(n, ast.Name)]
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names = [alias.asname or alias.name.split(".")[0] for alias in node.names]
+        else:
+            continue
+        if name in names:
+            return True
+
+    return False
+
+
 class AppHandler:
     """
     A class that encapsulates app path finding and module loading functionality.
@@ -103,12 +170,12 @@ class AppHandler:
         # Check pyproject.toml
         from pathlib import Path
 
-        import tomli
-
         pyproject_path = Path("pyproject.toml")
         if pyproject_path.exists():
+            import tomllib
+
             with open(pyproject_path, "rb") as f:
-                pyproject = tomli.load(f)
+                pyproject = tomllib.load(f)
                 if "tool" in pyproject and "unchained" in pyproject["tool"]:
                     if "app_path" in pyproject["tool"]["unchained"]:
                         return pyproject["tool"]["unchained"]["app_path"]
@@ -141,15 +208,10 @@ class AppHandler:
         if "" not in sys.path:
             sys.path.insert(0, "")
 
-        # Parse the app_path
-        module_path, app_instance = app_path.split(":", 1)
+        module_path, app_instance = split_app_path(app_path)
 
         # Check if module exists
         try:
-            # Just try to import to verify it exists
-            if module_path.endswith(".py"):
-                # If it's a .py file, remove the extension
-                module_path = module_path[:-3]
             module = importlib.import_module(module_path)
             return module, getattr(module, app_instance)
         except ImportError:
@@ -1,5 +1,8 @@
+from collections.abc import Callable
 from functools import partial
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar, cast
+
+from pydantic import BaseModel
 
 from unchained.dependencies.depends import Depends
 from unchained.signature.signature import Signature
@@ -7,9 +10,18 @@ from unchained.signature.signature import Signature
 T = TypeVar("T")
 
 
-class BaseCustom(Depends, Generic[T]):
-    annotation_type: type[T]
+_call_signatures: dict[type, Signature] = {}
+
+
+def _call_signature(cls: type) -> Signature:
+    """Signature of `cls.__call__` without `self`, computed once per class."""
+    if cls not in _call_signatures:
+        signature = Signature.from_callable(cls.__call__)
+        _call_signatures[cls] = signature.replace(parameters=list(signature.parameters.values())[1:])
+    return _call_signatures[cls]
+
 
+class BaseCustom(Depends, Generic[T]):
     def __init__(
         self,
         *,
@@ -17,8 +29,29 @@ class BaseCustom(Depends, Generic[T]):
         cast: bool = True,
     ) -> None:
         dependency = partial(self.__call__)
-        dependency.__signature__ = Signature.from_callable(self.__call__)
+        dependency.__signature__ = _call_signature(type(self))
         super().__init__(dependency, use_cache=use_cache, cast=cast)
         self.param_name: str | None = None
         self.annotation_type: type[T]
         self.default: type[T]
+
+    @property
+    def annotation_type(self) -> type[T]:
+        return self._annotation_type
+
+    @annotation_type.setter
+    def annotation_type(self, value: type[T]) -> None:
+        self._annotation_type = value
+        self._bind_annotation_type(value)
+
+    def _bind_annotation_type(self, annotation_type: type[T]) -> None:
+        """
+        Precompute everything `__call__` needs from the annotation type.
+
+        The annotation is bound once at decoration time, so this keeps the type checks out of the request path.
+        """
+        self._is_pydantic_model = isinstance(annotation_type, type) and issubclass(annotation_type, BaseModel)
+        # Models are validated from the whole mapping, other types are built from the raw value
+        self._validator: Callable[[Any], Any] = (
+            cast(type[BaseModel], annotation_type).model_validate if self._is_pydantic_model else annotation_type
+        )
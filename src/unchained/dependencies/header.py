@@ -1,7 +1,6 @@
+from inspect import Parameter
 from typing import Generic, TypeVar, cast
 
-from pydantic import BaseModel
-
 from unchained import Request
 from unchained.dependencies.custom import BaseCustom
 from unchained.ninja.errors import ValidationError
@@ -20,13 +19,16 @@ class Header(BaseCustom, Generic[T]):
     def __call__(self, request: Request) -> T | None:
         headers = request.headers
 
-        if issubclass(self.annotation_type, BaseModel):
-            return cast(T, self.annotation_type.model_validate(headers))
+        if self._is_pydantic_model:
+            return cast(T, self._validator(headers))
 
-        if self.param_name and self.param_name in headers:
-            return self.annotation_type(headers[self.param_name])  # type: ignore
+        # Single lookup: HttpHeaders is case-insensitive, so `in` then `[]` would normalize the name twice
+        value = headers.get(self.param_name) if self.param_name else None
+        if value is not None:
+            return self._validator(value)  # type: ignore
 
-        if self.default is not None:
+        # `default` is the handler parameter default, `Parameter.empty` when there is none
+        if self.default is not Parameter.empty:
             return self.default
 
         if self.required:
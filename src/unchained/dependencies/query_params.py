@@ -1,4 +1,5 @@
-from typing import Generic, TypeVar, cast, get_origin
+from inspect import Parameter
+from typing import Any, Generic, TypeVar, cast, get_origin
 
 from pydantic import BaseModel
 
@@ -13,27 +14,48 @@ T = TypeVar("T")
 class QueryParams(BaseCustom, Generic[T]):
     ITERABLES = (list, tuple, set)
 
-    def __init__(self, param_name: str | None = None, required: bool = True):
+    def __init__(self, param_name: str | None = None, required: bool = True, validate: bool = True):
         super().__init__()
         self.param_name = param_name
         self.required = required
+        # When False, models are built with `model_construct`: no validation nor coercion of the raw strings
+        self.validate = validate
         self.annotation_type: type[T]
         self.default: type[T]
 
+    def _bind_annotation_type(self, annotation_type: type[T]) -> None:
+        super()._bind_annotation_type(annotation_type)
+        origin = get_origin(annotation_type) or annotation_type
+        self._is_list = isinstance(origin, type) and issubclass(origin, list)
+        if self._is_pydantic_model:
+            model = cast(type[BaseModel], annotation_type)
+            # Which model fields are read with `getlist`, resolved once instead of per request
+            self._field_plan = [
+                (field_name, self._is_iterable_field(field.annotation))
+                for field_name, field in model.model_fields.items()
+            ]
+            if not self.validate:
+                self._validator = lambda model_input: model.model_construct(**model_input)
+
     def __call__(self, request: Request) -> T | None:
         query_params = request.query_params()
 
-        if issubclass(self.annotation_type, BaseModel):
+        if self._is_pydantic_model:
             model_input = self._get_model_values(query_params)
-            return cast(T, self.annotation_type.model_validate(model_input))
+            return cast(T, self._validator(model_input))
 
-        if self.param_name and self.param_name in query_params:
-            if issubclass(self.annotation_type, list):
-                return self.annotation_type(query_params.getlist(self.param_name))  # type: ignore
-            else:
-                return self.annotation_type(query_params[self.param_name])  # type: ignore
+        # Single lookup: `getlist`/`get` already tell a missing parameter apart, no need for a `in` check first
+        if self.param_name and self._is_list:
+            values = query_params.getlist(self.param_name)
+            if values:
+                return self.annotation_type(values)  # type: ignore
+        elif self.param_name:
+            value = query_params.get(self.param_name)
+            if value is not None:
+                return self._validator(value)  # type: ignore
 
-        if self.default is not None:
+        # `default` is the handler parameter default, `Parameter.empty` when there is none
+        if self.default is not Parameter.empty:
             return self.default
 
         if self.required:
@@ -43,27 +65,19 @@ class QueryParams(BaseCustom, Generic[T]):
     
     def _get_model_values(self, query_params: dict[str, str]) -> dict[str, str | list[str]]:
         model_values = {}
-    
-        for field_name, field in self.annotation_type.model_fields.items():
-            
+
+        for field_name, is_iterable in self._field_plan:
             if field_name not in query_params:
                 continue
-            
-            origin = get_origin(field.annotation)
 
-            if origin in self.ITERABLES:
+            if is_iterable:
                 model_values[field_name] = query_params.getlist(field_name)
-                continue
-            
-            try:
-                if issubclass(origin, self.ITERABLES):
-                    model_values[field_name] = query_params.getlist(field_name)
-                else:
-                    model_values[field_name] = query_params.get(field_name)
-            except TypeError:
+            else:
                 model_values[field_name] = query_params.get(field_name)
-            finally:
-                continue
-            
 
         return model_values
+
+    def _is_iterable_field(self, annotation: Any) -> bool:
+        origin = get_origin(annotation)
+        # `origin` is None for plain annotations and may be a typing special form (Union, Literal...)
+        return isinstance(origin, type) and issubclass(origin, self.ITERABLES)
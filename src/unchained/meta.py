@@ -7,7 +7,6 @@ from unchained.dependencies.custom import BaseCustom
 from unchained.request import Request
 from unchained.signature import Signature
 import functools
-import copy
 import asyncio
 
 from unchained.signature.transformers import create_signature_with_auto_dependencies, create_signature_without_annotated
@@ -27,9 +26,8 @@ class UnchainedBaseMeta(type):
 
                         # Get the signature of the API function
                         signature = Signature.from_callable(api_func)
-                        # TODO msut work but ????????????????????????????????????
-                        # _original_signature = Signature.from_callable(api_func)
-                        _original_signature = copy.deepcopy(signature)
+                        # Signatures are immutable, keeping a reference is enough to restore it afterwards
+                        _original_signature = signature
 
                         for param_name, param in signature.parameters.items():
                             if param.is_custom_depends:
@@ -49,12 +47,7 @@ class UnchainedBaseMeta(type):
                         # We remove the annotated parameters from the signature to allow Django Ninja to correctly parse the parameters
                         api_func.__signature__ = create_signature_without_annotated(signature_with_auto_dependencies)
 
-                        def _prepare_execution(func_args, func_kwargs):
-                            api_func.__signature__ = signature
-
-                            # Get the request parameter
-                            request = func_args[0]
-
+                        def _prepare_execution(request):
                             # This is a trick to override the class of the request ... After the instanciation
                             # `request` is an ASGIRequest instance from Django.
                             # `Request` is our custom class, that inherit from ASGIRequest.
@@ -65,27 +58,30 @@ class UnchainedBaseMeta(type):
                             # Set the context request in ContextVar
                             context.request.set(request)
 
-                            func_args = func_args[1:]
-                            return func_args, func_kwargs
-
-                        # Here is the sync last decorator
-                        @functools.wraps(api_func)
-                        def decorated(*func_args, **func_kwargs):
-                            func_args, func_kwargs = _prepare_execution(func_args, func_kwargs)
-                            # This is the API result:
-                            return injected(*func_args, **func_kwargs)
-
-                        # Here is the async last decorator
-                        @functools.wraps(api_func)
-                        async def adecorated(*func_args, **func_kwargs):
-                            func_args, func_kwargs = _prepare_execution(func_args, func_kwargs)
-                            # This is the API result:
-                            res = await injected(*func_args, **func_kwargs)
-                            return res
-
-                        result = http_method(*decorator_args, **decorator_kwargs)(
-                            adecorated if asyncio.iscoroutinefunction(api_func) else decorated
-                        )
+                        # Only the wrapper matching the handler is built and wrapped
+                        if asyncio.iscoroutinefunction(api_func):
+                            # Here is the async last decorator
+                            @functools.wraps(api_func)
+                            async def adecorated(request, *func_args, **func_kwargs):
+                                # The request is taken apart from the handler arguments, it is injected from the context
+                                _prepare_execution(request)
+                                # This is the API result:
+                                res = await injected(*func_args, **func_kwargs)
+                                return res
+
+                            view_func = adecorated
+                        else:
+                            # Here is the sync last decorator
+                            @functools.wraps(api_func)
+                            def decorated(request, *func_args, **func_kwargs):
+                                # The request is taken apart from the handler arguments, it is injected from the context
+                                _prepare_execution(request)
+                                # This is the API result:
+                                return injected(*func_args, **func_kwargs)
+
+                            view_func = decorated
+
+                        result = http_method(*decorator_args, **decorator_kwargs)(view_func)
 
                         api_func.__signature__ = _original_signature
                         result._original_api_func = api_func
@@ -129,6 +125,7 @@ class UnchainedMeta(UnchainedBaseMeta):
 
     def __new__(cls, name, bases, attrs):
         from django import setup as django_setup
+        from django.apps import apps
         from django.conf import settings as django_settings
 
         from unchained.settings import settings
@@ -139,8 +136,11 @@ class UnchainedMeta(UnchainedBaseMeta):
         for http_method in ["get", "post", "put", "patch", "delete"]:
             setattr(new_cls, http_method, cls._create_http_method(http_method, new_cls))
 
-        django_settings.configure(**settings.django.get_settings(), ROOT_URLCONF=new_cls)
-        django_setup()
+        # Django only needs to be set up once per process, subclasses reuse it
+        if not django_settings.configured:
+            django_settings.configure(**settings.django.get_settings(), ROOT_URLCONF=new_cls)
+        if not apps.ready:
+            django_setup()
 
         new_cls.settings = settings
 
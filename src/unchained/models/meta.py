@@ -3,6 +3,11 @@ from typing import Any, List, Type
 
 from django.db import models
 
+logger = logging.getLogger(__name__)
+
+# Shared by every model declared without a Meta, Django only reads it when building the model options
+_DEFAULT_META = type("Meta", (), {"app_label": "app"})
+
 
 class MainAppModelMeta(models.base.ModelBase):
     """Metaclass that automatically sets app_label to 'app' for all models"""
@@ -13,7 +18,7 @@ class MainAppModelMeta(models.base.ModelBase):
     def __new__(cls, name: str, bases: tuple[type, ...], attrs: dict[str, Any]) -> "MainAppModelMeta":
         # Set app_label in Meta if not already set
         if "Meta" not in attrs:
-            attrs["Meta"] = type("Meta", (), {"app_label": "app"})
+            attrs["Meta"] = _DEFAULT_META
         elif not hasattr(attrs["Meta"], "app_label"):
             setattr(attrs["Meta"], "app_label", "app")
 
@@ -21,5 +26,6 @@ class MainAppModelMeta(models.base.ModelBase):
         model_class = super().__new__(cls, name, bases, attrs)
         # And register it
         cls.models_registry.append(model_class)
-        logging.debug(cls.models_registry)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Registered models: %s", cls.models_registry)
         return model_class
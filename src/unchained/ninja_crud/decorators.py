@@ -51,6 +51,18 @@ def _rename_parameter(
 
         func.__signature__ = new_sig  # type: ignore
 
+        # Only define the wrapper that is actually returned
+        if is_async:
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:  # type: ignore
+                # Rename the keyword argument if present
+                if new_name in kwargs:
+                    kwargs[old_name] = kwargs.pop(new_name)
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:  # type: ignore
             # Rename the keyword argument if present
@@ -58,14 +70,7 @@ def _rename_parameter(
                 kwargs[old_name] = kwargs.pop(new_name)
             return func(*args, **kwargs)
 
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs) -> Any:  # type: ignore
-            # Rename the keyword argument if present
-            if new_name in kwargs:
-                kwargs[old_name] = kwargs.pop(new_name)
-            return await func(*args, **kwargs)
-
-        return async_wrapper if is_async else wrapper
+        return wrapper
 
     return decorator
 
@@ -3,7 +3,7 @@
 import functools
 from typing import Callable, Generic, cast, get_type_hints
 
-from django.db.models import QuerySet
+from django.db.models import Prefetch, QuerySet
 from pydantic import Field, create_model
 
 from unchained.ninja import FilterSchema, Router, Schema
@@ -55,12 +55,14 @@ class CRUDRouter(Generic[ModelType, CreateSchemaType, ReadSchemaType, UpdateSche
     ) -> None:
         self._model = model
         self._operations = operations
-        self._queryset = queryset or model.objects.all()
 
         self._create_schema = create_schema or self._generate_create_schema()
         self._read_schema = read_schema or self._generate_read_schema()
+        self._read_schema_generated = read_schema is None
         self._update_schema = update_schema or self._generate_update_schema()
         self._filter_schema = filter_schema or self._generate_filter_schema()
+        # `queryset or ...` would evaluate the queryset, hence the explicit None check
+        self._queryset = queryset if queryset is not None else self._generate_queryset()
         self._model_pk_python_type = NINJA_TYPES_MAP.get(model._meta.pk.get_internal_type(), int)
         self._pk_name = model._meta.pk.name
         self._swagger_description_model = str(model.__name__)
@@ -123,6 +125,25 @@ class CRUDRouter(Generic[ModelType, CreateSchemaType, ReadSchemaType, UpdateSche
         if "D" in self._operations:
             self._register_delete_item(viewset.delete_item)
 
+    def _generate_queryset(self) -> QuerySet:
+        """
+        Generate the default queryset for all operations.
+
+        Many-to-many fields exposed by the read schema are prefetched, otherwise each
+        serialized row triggers its own query. The generated read schema only outputs the
+        primary keys of the related objects, so only the primary keys are loaded. A custom
+        read schema may read any column of the related objects, so they are fully loaded.
+        Foreign keys are serialized from their `<name>_id` column and need no join.
+        """
+        prefetches = [
+            Prefetch(field.name, queryset=field.related_model._default_manager.only("pk"))
+            if self._read_schema_generated
+            else field.name
+            for field in self._model._meta.many_to_many
+            if field.name in self._read_schema.model_fields
+        ]
+        return self._model.objects.prefetch_related(*prefetches)
+
     def _generate_create_schema(self) -> type[Schema]:
         """
         Generate a schema for create operations.
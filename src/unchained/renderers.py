@@ -0,0 +1,33 @@
+from typing import Any
+
+import orjson
+from django.http import HttpRequest
+
+from unchained.ninja.renderers import JSONRenderer
+
+__all__ = ["ORJSONRenderer"]
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson, enabled with `Unchained(renderer=ORJSONRenderer())`.
+
+    Types orjson does not handle natively (Decimal, pydantic models, lazy strings...)
+    go through the Ninja JSON encoder, and datetimes are passed through it too so the
+    output format stays the same as the stdlib renderer. Payloads orjson refuses, such
+    as integers wider than 64 bits, are rendered by the stdlib renderer instead.
+
+    Unlike the stdlib renderer, NaN and infinities are rendered as null and Enum
+    members as their value.
+    """
+
+    option: int = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def __init__(self) -> None:
+        self._default = self.encoder_class().default
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        try:
+            return orjson.dumps(data, default=self._default, option=self.option)
+        except orjson.JSONEncodeError:
+            return super().render(request, data, response_status=response_status)
@@ -1,5 +1,16 @@
+import orjson
 from django.core.handlers.asgi import ASGIRequest
 
 class Request(ASGIRequest):
     def query_params(self):
         return self.GET
+
+    @property
+    def has_body(self):
+        return bool(self.body)
+
+    def json(self):
+        # Parsed once per request, so dependencies and the handler can all read it
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(self.body)
+        return self._json
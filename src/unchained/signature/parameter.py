@@ -1,5 +1,6 @@
 import inspect
-from typing import Annotated, get_args, get_origin
+from functools import cached_property
+from typing import Annotated, Any, get_args, get_origin
 
 from django.http import HttpRequest
 from unchained.base import BaseUnchained
@@ -8,61 +9,66 @@ from unchained.settings.base import UnchainedSettings
 from unchained.states import BaseState
 
 
+def _is_subclass(annotation: Any, cls: type) -> bool:
+    """`issubclass` that is False for annotations that are not classes (unions, generic aliases...)."""
+    return isinstance(annotation, type) and issubclass(annotation, cls)
+
+
 class Parameter(inspect.Parameter):
     """
     A custom parameter class that extends inspect.Parameter to add Unchained-specific functionality.
     """
 
-    @property
+    @cached_property
     def is_annotated(self) -> bool:
         """Check if the parameter is annotated."""
-        return hasattr(self.annotation, "__origin__") and get_origin(self.annotation) is Annotated
+        return get_origin(self.annotation) is Annotated
+
+    @cached_property
+    def annotated_instance(self) -> Any:
+        """The metadata instance of an annotated parameter, extracted once for all the `is_*` checks."""
+        _, instance = get_args(self.annotation)
+        return instance
 
     @property
     def is_request(self) -> bool:
         if self.is_annotated:
-            _, instance = get_args(self.annotation)
-            return isinstance(instance, HttpRequest)
-        return issubclass(self.annotation, HttpRequest)
+            return isinstance(self.annotated_instance, HttpRequest)
+        return _is_subclass(self.annotation, HttpRequest)
 
     @property
     def is_settings(self) -> bool:
         if self.is_annotated:
-            _, instance = get_args(self.annotation)
-            return isinstance(instance, UnchainedSettings)
-        return issubclass(self.annotation, UnchainedSettings)
+            return isinstance(self.annotated_instance, UnchainedSettings)
+        return _is_subclass(self.annotation, UnchainedSettings)
 
     @property
     def is_app(self) -> bool:
         if self.is_annotated:
-            _, instance = get_args(self.annotation)
-            return isinstance(instance, BaseUnchained)
-        return issubclass(self.annotation, BaseUnchained)
+            return isinstance(self.annotated_instance, BaseUnchained)
+        return _is_subclass(self.annotation, BaseUnchained)
 
     @property
     def is_header(self) -> bool:
         from unchained.dependencies.header import Header
 
         if self.is_annotated:
-            _, instance = get_args(self.annotation)
-            return isinstance(instance, Header)
-        return issubclass(self.annotation, Header)
+            return isinstance(self.annotated_instance, Header)
+        return _is_subclass(self.annotation, Header)
     
     @property
     def is_query_params(self) -> bool:
         from unchained.dependencies.query_params import QueryParams
 
         if self.is_annotated:
-            _, instance = get_args(self.annotation)
-            return isinstance(instance, QueryParams)
-        return issubclass(self.annotation, QueryParams)
+            return isinstance(self.annotated_instance, QueryParams)
+        return _is_subclass(self.annotation, QueryParams)
 
     @property
     def is_state(self) -> bool:
         if self.is_annotated:
-            _, instance = get_args(self.annotation)
-            return isinstance(instance, BaseState)
-        return issubclass(self.annotation, BaseState)
+            return isinstance(self.annotated_instance, BaseState)
+        return _is_subclass(self.annotation, BaseState)
 
     @property
     def is_depends(self) -> bool:
@@ -70,9 +76,8 @@ class Parameter(inspect.Parameter):
         from unchained.dependencies.depends import Depends
 
         if self.is_annotated:
-            _, instance = get_args(self.annotation)
-            return isinstance(instance, Depends)
-        return issubclass(self.annotation, Depends)
+            return isinstance(self.annotated_instance, Depends)
+        return _is_subclass(self.annotation, Depends)
 
     @property
     def is_auto_depends(self) -> bool:
@@ -85,9 +90,8 @@ class Parameter(inspect.Parameter):
         from unchained.dependencies.custom import BaseCustom
 
         if self.is_annotated:
-            _, instance = get_args(self.annotation)
-            return isinstance(instance, BaseCustom)
-        return issubclass(self.annotation, BaseCustom)
+            return isinstance(self.annotated_instance, BaseCustom)
+        return _is_subclass(self.annotation, BaseCustom)
 
     @classmethod
     def from_parameter(cls, param: inspect.Parameter) -> "Parameter":
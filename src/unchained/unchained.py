@@ -103,12 +103,15 @@ class Unchained(BaseUnchained, metaclass=UnchainedMeta):
         self.add_router(router.path, router.router)
 
     def __call__(self, *args, **kwargs):
+        from django.apps import apps
         from django.conf import settings
         from django.conf.urls.static import static
-        from django.contrib import admin
 
         self.urlpatterns.add(self._path("api/", self.urls))
-        self.urlpatterns.add(self._path("admin/", admin.site.urls))
+        if apps.is_installed("django.contrib.admin"):
+            from django.contrib import admin
+
+            self.urlpatterns.add(self._path("admin/", admin.site.urls))
         if settings.DEBUG:
             self.urlpatterns.add(static(settings.STATIC_URL, document_root=settings.STATIC_ROOT))
         return self.app
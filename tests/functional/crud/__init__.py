@@ -0,0 +1,6 @@
+"""Functional tests for the CRUD router."""
+
+PATH = "/books/"
+LAZY_PATH = "/lazy-books/"
+POSTS_PATH = "/posts/"
+TAGGED_POSTS_PATH = "/tagged-posts/"
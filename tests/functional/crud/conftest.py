@@ -0,0 +1,9 @@
+import pytest
+
+from unchained.ninja.conf import settings as ninja_settings
+
+
+@pytest.fixture(autouse=True)
+def pagination_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The vendored ninja settings still point to the standalone package
+    monkeypatch.setattr(ninja_settings, "PAGINATION_CLASS", "unchained.ninja.pagination.LimitOffsetPagination")
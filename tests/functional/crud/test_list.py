@@ -0,0 +1,91 @@
+from collections.abc import Iterator
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from pydantic import Field
+
+from tests.functional.crud import LAZY_PATH, PATH
+from tests.utils.client import UnchainedAsyncTestClient
+from unchained import Unchained
+from unchained.models.base import BaseModel
+from unchained.ninja import Schema
+from unchained.ninja.testing.client import NinjaResponse
+
+
+class Author(BaseModel):
+    name = models.CharField(max_length=100)
+
+
+class Book(BaseModel):
+    title = models.CharField(max_length=100)
+    author = models.ForeignKey(Author, on_delete=models.CASCADE)
+
+
+class BookRead(Schema):
+    id: int
+    title: str
+    writer: int = Field(alias="author_id")
+    author_name: str
+
+    @staticmethod
+    def resolve_author_name(obj: Book) -> str:
+        return obj.author.name
+
+
+class BookAuthorRead(Schema):
+    id: int
+    author_name: str
+
+    @staticmethod
+    def resolve_author_name(obj: Book) -> str:
+        return obj.author.name
+
+
+@pytest.fixture
+def books() -> Iterator[list[Book]]:
+    with connection.schema_editor() as editor:
+        editor.create_model(Author)
+        editor.create_model(Book)
+    author = Author.objects.create(name="Jane")
+    yield [Book.objects.create(title=f"Book {index}", author=author) for index in range(5)]
+    with connection.schema_editor() as editor:
+        editor.delete_model(Book)
+        editor.delete_model(Author)
+
+
+def get(client: UnchainedAsyncTestClient, path: str) -> NinjaResponse:
+    """Run the request from the test thread, so the ORM work runs on the test database connection"""
+
+    async def request() -> NinjaResponse:
+        return await client.get(path)
+
+    return async_to_sync(request)()
+
+
+@pytest.fixture
+def client(app: Unchained, async_test_client: UnchainedAsyncTestClient) -> UnchainedAsyncTestClient:
+    app.crud(Book, read_schema=BookRead, queryset=Book.objects.select_related("author"), path="books")
+    app.crud(Book, read_schema=BookAuthorRead, path="lazy-books")
+    return async_test_client
+
+
+def test_list_custom_read_schema(client: UnchainedAsyncTestClient, books: list[Book]) -> None:
+    with CaptureQueriesContext(connection) as queries:
+        response = get(client, PATH)
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["author_name"] for item in items] == ["Jane"] * len(books)
+    assert [item["writer"] for item in items] == [book.author_id for book in books]
+    # The page count and the rows themselves, the alias and the resolver need no extra query
+    assert len(queries) == 2
+
+
+def test_list_custom_read_schema_lazy_relation(client: UnchainedAsyncTestClient, books: list[Book]) -> None:
+    # Without a custom queryset the resolver loads the author of each row, which must not happen on the event loop
+    response = get(client, LAZY_PATH)
+
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"id": book.id, "author_name": "Jane"} for book in books]
@@ -0,0 +1,74 @@
+from collections.abc import Iterator
+
+import pytest
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from tests.functional.crud import POSTS_PATH, TAGGED_POSTS_PATH
+from tests.utils.client import UnchainedTestClient
+from unchained import Unchained
+from unchained.models.base import BaseModel
+from unchained.ninja import Schema
+
+
+class Tag(BaseModel):
+    name = models.CharField(max_length=100)
+
+
+class Post(BaseModel):
+    title = models.CharField(max_length=100)
+    tags = models.ManyToManyField(Tag)
+
+
+class TagOut(Schema):
+    id: int
+    name: str
+
+
+class PostRead(Schema):
+    id: int
+    title: str
+    tags: list[TagOut]
+
+
+@pytest.fixture
+def posts() -> Iterator[list[Post]]:
+    with connection.schema_editor() as editor:
+        editor.create_model(Tag)
+        editor.create_model(Post)
+    tags = [Tag.objects.create(name=f"Tag {index}") for index in range(2)]
+    posts = [Post.objects.create(title=f"Post {index}") for index in range(3)]
+    for post in posts:
+        post.tags.set(tags)
+    yield posts
+    with connection.schema_editor() as editor:
+        editor.delete_model(Post)
+        editor.delete_model(Tag)
+
+
+@pytest.fixture
+def client(app: Unchained, test_client: UnchainedTestClient) -> UnchainedTestClient:
+    app.crud(Post, path="posts")
+    app.crud(Post, read_schema=PostRead, path="tagged-posts")
+    return test_client
+
+
+def test_list_generated_read_schema(client: UnchainedTestClient, posts: list[Post]) -> None:
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(POSTS_PATH)
+
+    assert response.status_code == 200
+    assert [item["tags"] for item in response.json()["items"]] == [[1, 2]] * len(posts)
+    # The page count, the rows and a single prefetch of the tags
+    assert len(queries) == 3
+
+
+def test_list_custom_read_schema(client: UnchainedTestClient, posts: list[Post]) -> None:
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(TAGGED_POSTS_PATH)
+
+    assert response.status_code == 200
+    expected_tags = [{"id": 1, "name": "Tag 0"}, {"id": 2, "name": "Tag 1"}]
+    assert [item["tags"] for item in response.json()["items"]] == [expected_tags] * len(posts)
+    # The nested tags read their name, which must be prefetched too instead of loaded tag by tag
+    assert len(queries) == 3
@@ -1,2 +1,3 @@
 PATH = "/header-dependency"
 TEST_HEADER_VALUE = "test-header-value"
+DEFAULT_PATH = "/header-dependency-default"
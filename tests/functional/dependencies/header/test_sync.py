@@ -3,7 +3,7 @@ from typing import Annotated
 import pytest
 
 from tests.functional import SUPPORTED_HTTP_METHODS
-from tests.functional.dependencies.header import PATH, TEST_HEADER_VALUE
+from tests.functional.dependencies.header import DEFAULT_PATH, PATH, TEST_HEADER_VALUE
 from tests.utils.client import UnchainedTestClient
 from unchained import Unchained
 from unchained.dependencies.header import Header
@@ -25,3 +25,17 @@ def test_header_dependency(client: UnchainedTestClient, method: str) -> None:
     response = getattr(client, method)(PATH, headers={"X-API-Key": TEST_HEADER_VALUE})
     assert response.status_code == 200
     assert response.json() == TEST_HEADER_VALUE
+
+
+@pytest.mark.parametrize("default", [0, "", None])
+def test_header_dependency_missing_with_falsy_default(
+    app: Unchained, test_client: UnchainedTestClient, default: int | str | None
+) -> None:
+    def header_default_route(x_api_key: Annotated[int | str | None, Header()] = default) -> int | str | None:
+        return x_api_key
+
+    app.get(DEFAULT_PATH)(header_default_route)
+
+    response = test_client.get(DEFAULT_PATH)
+    assert response.status_code == 200
+    assert response.json() == default
@@ -0,0 +1,3 @@
+"""Tests for the query params dependency."""
+
+PATH = "/query-params"
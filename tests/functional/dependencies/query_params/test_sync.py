@@ -0,0 +1,40 @@
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel
+
+from tests.functional.dependencies.query_params import PATH
+from tests.utils.client import UnchainedTestClient
+from unchained import Unchained
+from unchained.dependencies.query_params import QueryParams
+
+
+class Filters(BaseModel):
+    page: int
+    tags: list[str] = []
+
+
+@pytest.fixture
+def client(app: Unchained, test_client: UnchainedTestClient) -> UnchainedTestClient:
+    def validated_route(filters: Annotated[Filters, QueryParams()]) -> dict:
+        return {"page": filters.page, "page_type": type(filters.page).__name__, "tags": filters.tags}
+
+    def unvalidated_route(filters: Annotated[Filters, QueryParams(validate=False)]) -> dict:
+        return {"page": filters.page, "page_type": type(filters.page).__name__, "tags": filters.tags}
+
+    app.get(f"{PATH}/validated")(validated_route)
+    app.get(f"{PATH}/unvalidated")(unvalidated_route)
+    return test_client
+
+
+def test_query_params_model_is_validated(client: UnchainedTestClient) -> None:
+    response = client.get(f"{PATH}/validated?page=2&tags=a&tags=b")
+    assert response.status_code == 200
+    assert response.json() == {"page": 2, "page_type": "int", "tags": ["a", "b"]}
+
+
+def test_query_params_model_without_validation(client: UnchainedTestClient) -> None:
+    response = client.get(f"{PATH}/unvalidated?page=not-a-number&tags=a&tags=b")
+    assert response.status_code == 200
+    # The raw strings are passed through as is, even when they do not match the annotations
+    assert response.json() == {"page": "not-a-number", "page_type": "str", "tags": ["a", "b"]}
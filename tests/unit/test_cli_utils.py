@@ -0,0 +1,65 @@
+import importlib
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from unchained.cli import utils
+from unchained.cli.utils import get_app_import_string
+
+
+@pytest.fixture
+def app_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    yield tmp_path
+    for name in [name for name in sys.modules if name.startswith("cli_app_")]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def loaded_apps(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    loaded: list[str] = []
+    monkeypatch.setattr(utils, "load_app_module", loaded.append)
+    return loaded
+
+
+def test_missing_module(app_dir: Path) -> None:
+    with pytest.raises(SystemExit):
+        get_app_import_string("cli_app_missing:app")
+
+
+def test_missing_parent_package(app_dir: Path) -> None:
+    with pytest.raises(SystemExit):
+        get_app_import_string("cli_app_missing.main:app")
+
+
+@pytest.mark.parametrize("app_path", ["cli_app_found:app", "cli_app_found.py:app"])
+def test_instance_found_in_source(app_dir: Path, loaded_apps: list[str], app_path: str) -> None:
+    (app_dir / "cli_app_found.py").write_text("from unchained import Unchained\n\napp: Unchained = Unchained()\n")
+
+    assert get_app_import_string(app_path) == "cli_app_found:app"
+    assert loaded_apps == []
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "from cli_app_found import *\n",
+        "from unchained import Unchained\n\napp: Unchained\n",
+    ],
+)
+def test_instance_not_found_in_source_imports_module(app_dir: Path, loaded_apps: list[str], source: str) -> None:
+    (app_dir / "cli_app_other.py").write_text(source)
+
+    assert get_app_import_string("cli_app_other:app") == "cli_app_other:app"
+    assert loaded_apps == ["cli_app_other:app"]
+
+
+def test_missing_instance(app_dir: Path) -> None:
+    (app_dir / "cli_app_typo.py").write_text("value = 1\n")
+
+    with pytest.raises(SystemExit):
+        get_app_import_string("cli_app_typo:app")
@@ -0,0 +1,12 @@
+from django.apps import apps
+from django.conf import settings
+
+from unchained import Unchained
+
+
+def test_unchained_subclass_reuses_django_setup() -> None:
+    class CustomUnchained(Unchained): ...
+
+    assert settings.configured
+    assert apps.ready
+    assert CustomUnchained.settings is Unchained.settings
@@ -0,0 +1,36 @@
+import json
+import math
+from enum import Enum
+
+import pytest
+
+from unchained import Unchained
+from unchained.ninja.renderers import JSONRenderer
+from unchained.renderers import ORJSONRenderer
+
+
+class Color(Enum):
+    RED = "red"
+
+
+def render(renderer: JSONRenderer, data: object) -> object:
+    return json.loads(renderer.render(None, data, response_status=200))  # type: ignore[arg-type]
+
+
+def test_default_renderer_is_stdlib() -> None:
+    assert type(Unchained().renderer) is JSONRenderer
+
+
+def test_orjson_renderer_falls_back_on_big_integers() -> None:
+    data = {"big": 2**70, "small": 1}
+    assert render(ORJSONRenderer(), data) == render(JSONRenderer(), data) == data
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_orjson_renderer_non_finite_floats(value: float) -> None:
+    assert render(ORJSONRenderer(), {"value": value}) == {"value": None}
+
+
+def test_orjson_renderer_enum() -> None:
+    assert render(ORJSONRenderer(), {"color": Color.RED}) == {"color": "red"}
+    assert render(JSONRenderer(), {"color": Color.RED}) == {"color": "Color.RED"}
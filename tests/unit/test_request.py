@@ -0,0 +1,50 @@
+import orjson
+import pytest
+from django.test import RequestFactory
+
+from unchained import Request
+
+
+def build_request(body: bytes) -> Request:
+    request = RequestFactory().post("/", data=body, content_type="application/json")
+    request.__class__ = Request
+    return request
+
+
+def test_json_parses_body() -> None:
+    request = build_request(b'{"name": "unchained", "tags": [1, 2]}')
+
+    assert request.json() == {"name": "unchained", "tags": [1, 2]}
+
+
+def test_json_is_cached() -> None:
+    request = build_request(b'{"name": "unchained"}')
+
+    data = request.json()
+
+    assert request._json is data
+    assert request.json() is data
+
+
+def test_json_invalid_body() -> None:
+    request = build_request(b"{not json")
+
+    with pytest.raises(orjson.JSONDecodeError):
+        request.json()
+
+
+def test_json_parses_body_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    request = build_request(b'{"name": "unchained"}')
+    calls = []
+    loads = orjson.loads
+    monkeypatch.setattr(orjson, "loads", lambda body: calls.append(body) or loads(body))
+
+    request.json()
+    request.json()
+
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(("body", "has_body"), [(b"", False), (b'{"name": "unchained"}', True)])
+def test_has_body(body: bytes, has_body: bool) -> None:
+    assert build_request(body).has_body is has_body
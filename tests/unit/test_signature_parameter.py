@@ -0,0 +1,14 @@
+import inspect
+
+import pytest
+
+from unchained.signature.parameter import Parameter
+
+
+@pytest.mark.parametrize("annotation", [int | None, list[int], inspect.Parameter.empty])
+def test_parameter_checks_accept_non_class_annotations(annotation: object) -> None:
+    param = Parameter("param", Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation)
+
+    assert not param.is_request
+    assert not param.is_auto_depends
+    assert not param.is_custom_depends
@@ -6,11 +6,19 @@ from unchained.ninja.testing import TestClient as NinjaTestClient
 from unchained.ninja.testing.client import NinjaResponse
 
 
-class UnchainedTestClient(NinjaTestClient):
+class UnchainedRequestMixin:
+    def _build_request(self, method: str, path: str, data: Dict, request_params: Any) -> Mock:
+        request = super()._build_request(method, path, data, request_params)  # type: ignore[misc]
+        # Mirrors `unchained.Request.query_params`
+        request.query_params = lambda: request.GET
+        return request
+
+
+class UnchainedTestClient(UnchainedRequestMixin, NinjaTestClient):
     pass
 
 
-class UnchainedAsyncTestClient(NinjaAsyncTestClient):
+class UnchainedAsyncTestClient(UnchainedRequestMixin, NinjaAsyncTestClient):
     async def _call(self, func: Callable, request: Mock, kwargs: Dict) -> "NinjaResponse":
         res = await func(request, **kwargs)
         return NinjaResponse(res)